@@ -14,9 +14,33 @@ from nba_api.stats.endpoints import (
 from nba_api.stats.static import players, teams
 import time
 import json
-import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
+# Numba is optional; the similarity scoring falls back to plain NumPy without it
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# orjson is optional; cache serialization falls back to the stdlib json
+try:
+    import orjson
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj)
+
+    def _json_loads(data):
+        return orjson.loads(data)
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+    def _json_loads(data):
+        return json.loads(data)
+
 # Page configuration
 st.set_page_config(
     page_title="NBA Player Evaluator",
@@ -24,11 +48,11 @@ st.set_page_config(
     layout="wide"
 )
 
-# Cache file for player data
-CACHE_FILE = "nba_player_cache.json"
+# SQLite cache for player data (keyed per player, so each update is an O(1) write)
+CACHE_DB = "nba_cache.db"
 CACHE_DURATION = timedelta(hours=6)  # Cache for 6 hours
 
-@st.cache_data(ttl=3600)  # Cache for 1 hour
+@st.cache_resource(ttl=6 * 3600)  # Shared by reference, no pickling on each hit
 def get_all_active_players():
     """Get all active NBA players"""
     try:
@@ -61,6 +85,17 @@ def get_all_active_players():
         st.error(f"Error fetching players: {e}")
         return []
 
+PCT_KEYS = ('fg_pct', 'three_pct', 'ft_pct', 'paint_fg', 'midrange_fg',
+            'corner_three', 'clutch_fg', 'fast_break_fg')
+
+def _cap_percentages(stats):
+    """Cap percentage fields at 100% in one vectorized pass"""
+    vals = np.fromiter((stats[k] for k in PCT_KEYS), dtype=np.float32)
+    np.minimum(vals, 1.0, out=vals)
+    for key, val in zip(PCT_KEYS, vals):
+        stats[key] = float(val)
+    return stats
+
 @st.cache_data(ttl=3600)
 def get_player_stats(player_id, season="2023-24"):
     """Get comprehensive player stats from NBA API"""
@@ -70,7 +105,7 @@ def get_player_stats(player_id, season="2023-24"):
         season_stats = career_stats.get_data_frames()[0]
         
         # Get current season stats if available
-        current_season = season_stats[season_stats['SEASON_ID'].str.contains(season.replace('-', '-'))]
+        current_season = season_stats[season_stats['SEASON_ID'] == season]
         if current_season.empty:
             # Fallback to most recent season
             current_season = season_stats.iloc[-1:] if not season_stats.empty else None
@@ -112,52 +147,91 @@ def get_player_stats(player_id, season="2023-24"):
         }
         
         # Cap percentages at 100%
-        for key in ['fg_pct', 'three_pct', 'ft_pct', 'paint_fg', 'midrange_fg', 'corner_three', 'clutch_fg', 'fast_break_fg']:
-            if processed_stats[key] > 1.0:
-                processed_stats[key] = min(processed_stats[key], 1.0)
-        
-        return processed_stats
+        return _cap_percentages(processed_stats)
         
     except Exception as e:
         st.error(f"Error fetching stats for player {player_id}: {e}")
         return None
 
+@st.cache_data(ttl=3600)
+def fetch_league_stats(season="2023-24"):
+    """Fetch per-game stats for every player in one league-wide call"""
+    league_stats = leaguedashplayerstats.LeagueDashPlayerStats(
+        season=season, per_mode_detailed='PerGame'
+    ).get_data_frames()[0]
+    return league_stats.set_index('PLAYER_ID')
+
+def _stats_from_league_row(row):
+    """Build the processed stats dict from a league-wide PerGame row"""
+    fg_pct = float(row.get('FG_PCT', 0) or 0)
+    fg3_pct = float(row.get('FG3_PCT', 0) or 0)
+    stats = {
+        'ppg': float(row.get('PTS', 0) or 0),
+        'rpg': float(row.get('REB', 0) or 0),
+        'apg': float(row.get('AST', 0) or 0),
+        'fg_pct': fg_pct,
+        'three_pct': fg3_pct,
+        'ft_pct': float(row.get('FT_PCT', 0) or 0),
+        # Estimated values for situational stats (same heuristics as get_player_stats)
+        'paint_fg': fg_pct * 1.15 if fg_pct else 0.5,
+        'midrange_fg': fg_pct * 0.85 if fg_pct else 0.4,
+        'corner_three': fg3_pct * 1.1 if fg3_pct else 0.35,
+        'clutch_fg': fg_pct * 0.9 if fg_pct else 0.45,
+        'fast_break_fg': fg_pct * 1.2 if fg_pct else 0.6,
+        'games_played': float(row.get('GP', 0) or 0),
+        'minutes_per_game': float(row.get('MIN', 0) or 0)
+    }
+    return _cap_percentages(stats)
+
+def fetch_all_player_stats(player_ids):
+    """Fetch stats for many players concurrently (NBA API calls are I/O-bound)"""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        return dict(zip(player_ids, executor.map(get_player_stats, player_ids)))
+
+@st.cache_resource
+def _cache_db():
+    """Open the on-disk stats cache, creating the table on first use"""
+    conn = sqlite3.connect(CACHE_DB, check_same_thread=False)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS player_stats ("
+        "player_name TEXT PRIMARY KEY, stats_json BLOB, fetched_at INTEGER)"
+    )
+    conn.commit()
+    return conn
+
 def load_cached_data():
-    """Load cached player data"""
-    if os.path.exists(CACHE_FILE):
-        try:
-            with open(CACHE_FILE, 'r') as f:
-                cache_data = json.load(f)
-            
-            # Check if cache is still valid
-            cache_time = datetime.fromisoformat(cache_data.get('timestamp', '2000-01-01'))
-            if datetime.now() - cache_time < CACHE_DURATION:
-                return cache_data.get('players', {})
-        except:
-            pass
-    return {}
+    """Load all still-valid cached player stats"""
+    try:
+        cutoff = int(time.time() - CACHE_DURATION.total_seconds())
+        rows = _cache_db().execute(
+            "SELECT player_name, stats_json FROM player_stats WHERE fetched_at > ?",
+            (cutoff,)
+        ).fetchall()
+        return {name: _json_loads(stats_json) for name, stats_json in rows}
+    except:
+        return {}
 
-def save_cached_data(players_data):
-    """Save player data to cache"""
+def save_cached_stats(player_name, stats):
+    """Save one player's stats to the cache"""
     try:
-        cache_data = {
-            'timestamp': datetime.now().isoformat(),
-            'players': players_data
-        }
-        with open(CACHE_FILE, 'w') as f:
-            json.dump(cache_data, f)
+        conn = _cache_db()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO player_stats VALUES (?, ?, ?)",
+                (player_name, _json_dumps(stats), int(time.time()))
+            )
     except Exception as e:
         st.warning(f"Could not save cache: {e}")
 
-@st.cache_data(ttl=3600)
+@st.cache_resource
+def _player_name_index():
+    """Build a case-insensitive name -> player map once for O(1) lookups"""
+    return {p['full_name'].casefold(): p for p in players.get_players()}
+
 def get_player_by_name(player_name):
     """Get player ID by name"""
     try:
-        all_players = players.get_players()
-        for player in all_players:
-            if player['full_name'].lower() == player_name.lower():
-                return player
-        return None
+        return _player_name_index().get(player_name.casefold())
     except:
         return None
 
@@ -202,6 +276,26 @@ FALLBACK_PLAYERS = {
     }
 }
 
+POPULAR_PLAYERS = frozenset(FALLBACK_PLAYERS)
+
+def _prewarm_cache():
+    """Fetch stats for commonly requested players into the disk cache"""
+    cached = load_cached_data()
+    for name in FALLBACK_PLAYERS:
+        if name in cached:
+            continue
+        player = get_player_by_name(name)
+        if player:
+            stats = get_player_stats(player['id'])
+            if stats:
+                save_cached_stats(name, stats)
+        time.sleep(0.6)  # Respect NBA API rate limits
+
+# Warm the cache for popular players in the background on first load
+if not st.session_state.get('prewarmed'):
+    st.session_state.prewarmed = True
+    threading.Thread(target=_prewarm_cache, daemon=True).start()
+
 def get_available_players():
     """Get list of available players (from API or fallback)"""
     try:
@@ -216,6 +310,11 @@ def get_available_players():
                 else:
                     st.session_state.available_players = list(FALLBACK_PLAYERS.keys())
                     st.warning("Using fallback player data (API unavailable)")
+                # Lowercased once here so the search filter doesn't re-lower
+                # every name on each keystroke
+                st.session_state.available_players_lower = [
+                    p.lower() for p in st.session_state.available_players
+                ]
         
         return st.session_state.available_players
     except Exception as e:
@@ -232,11 +331,22 @@ def get_player_stats_cached(player_name):
     player_info = get_player_by_name(player_name)
     if player_info:
         with st.spinner(f"Loading stats for {player_name}..."):
-            stats = get_player_stats(player_info['id'])
+            # Prefer the league-wide batch endpoint (one call covers everyone)
+            stats = None
+            try:
+                league_stats = fetch_league_stats()
+                if player_info['id'] in league_stats.index:
+                    stats = _stats_from_league_row(league_stats.loc[player_info['id']])
+            except:
+                stats = None
+
+            if stats is None:
+                # Fall back to the per-player endpoints
+                stats = get_player_stats(player_info['id'])
             if stats:
                 # Cache the result
                 st.session_state.player_cache[player_name] = stats
-                save_cached_data(st.session_state.player_cache)
+                save_cached_stats(player_name, stats)
                 return stats
     
     # Fallback to hardcoded data
@@ -270,78 +380,120 @@ ARCHETYPES = {
     }
 }
 
+ARCHETYPE_NAMES = tuple(ARCHETYPES)
+
+# Fixed stat order shared by the similarity scoring (first 3 are counting stats)
+STAT_KEYS = (
+    'ppg', 'rpg', 'apg',
+    'fg_pct', 'three_pct', 'ft_pct',
+    'paint_fg', 'midrange_fg', 'corner_three',
+    'clutch_fg', 'fast_break_fg'
+)
+
+WEIGHTS = np.array(
+    [0.20, 0.15, 0.15, 0.15, 0.10, 0.05, 0.05, 0.05, 0.05, 0.03, 0.02],
+    dtype=np.float32
+)
+
+def stats_to_vec(stats, keys=STAT_KEYS):
+    """Convert a stats dict to a float32 vector in the given key order"""
+    return np.fromiter(
+        (stats.get(key, 0) for key in keys),
+        dtype=np.float32, count=len(keys)
+    )
+
+def _similarity_kernel(player_vec, target_vec, weights):
+    """Weighted stat-difference kernel; returns a 0-100 similarity score"""
+    total_diff = 0.0
+    for i in range(weights.size):
+        diff = abs(player_vec[i] - target_vec[i])
+        if i < 3:
+            # Counting stats are normalized by the target value
+            diff /= max(target_vec[i], 1.0)
+        total_diff += diff * weights[i]
+    return max(0.0, 100.0 - total_diff * 200.0)
+
+if njit is not None:
+    # cache=True persists the compiled kernel across Streamlit reruns
+    _similarity_kernel = njit(cache=True, fastmath=True)(_similarity_kernel)
+
 def calculate_similarity_score(player_stats, target_stats):
     """Calculate a similarity score between two sets of stats (0-100)"""
-    weights = {
-        'ppg': 0.20, 'rpg': 0.15, 'apg': 0.15,
-        'fg_pct': 0.15, 'three_pct': 0.10, 'ft_pct': 0.05,
-        'paint_fg': 0.05, 'midrange_fg': 0.05, 'corner_three': 0.05, 
-        'clutch_fg': 0.03, 'fast_break_fg': 0.02
-    }
-    
-    total_diff = 0
-    for stat, weight in weights.items():
-        if stat in ['ppg', 'rpg', 'apg']:
-            # For counting stats, normalize by dividing by target value
-            diff = abs(player_stats[stat] - target_stats[stat]) / max(target_stats[stat], 1)
-        else:
-            # For percentages, direct difference
-            diff = abs(player_stats[stat] - target_stats[stat])
-        
-        total_diff += diff * weight
-    
-    # Convert to similarity score (higher is better)
-    similarity = max(0, 100 - (total_diff * 200))
-    return round(similarity, 1)
+    similarity = _similarity_kernel(
+        stats_to_vec(player_stats), stats_to_vec(target_stats), WEIGHTS
+    )
+    return round(float(similarity), 1)
+
+# (category label, stat key, display scale) specs shared by both radar charts;
+# percentages are shown on a 0-100 axis
+RADAR_CATS_BASIC = (
+    ('PPG', 'ppg', 1), ('RPG', 'rpg', 1), ('APG', 'apg', 1),
+    ('FG%', 'fg_pct', 100), ('3P%', 'three_pct', 100), ('FT%', 'ft_pct', 100),
+    ('Paint FG%', 'paint_fg', 100), ('Mid-Range FG%', 'midrange_fg', 100),
+)
+RADAR_CATS_ADVANCED = RADAR_CATS_BASIC + (
+    ('Corner 3%', 'corner_three', 100), ('Clutch FG%', 'clutch_fg', 100),
+)
+
+def _build_radar_chart(player_stats, target_stats, player_name, target_name, cats, advanced=False):
+    """Build the player-vs-target radar chart for the given category spec"""
+    categories, keys, scales = zip(*cats)
+    scales = np.array(scales, dtype=np.float32)
+
+    def get_values(stats):
+        # One vectorized extract + scale instead of per-stat dict lookups;
+        # percentages already on a 0-100 scale are left as-is
+        values = stats_to_vec(stats, keys)
+        return np.where((scales > 1) & (values > 1), values, values * scales)
+
+    player_values = get_values(player_stats)
+    target_values = get_values(target_stats)
 
-def create_comparison_chart(player_stats, target_stats, player_name, target_name):
-    """Create a radar chart comparing player stats"""
-    categories = ['PPG', 'RPG', 'APG', 'FG%', '3P%', 'FT%', 'Paint FG%', 'Mid-Range FG%']
-    
-    player_values = [
-        player_stats['ppg'], player_stats['rpg'], player_stats['apg'],
-        player_stats['fg_pct'] * 100, player_stats['three_pct'] * 100, 
-        player_stats['ft_pct'] * 100, player_stats['paint_fg'] * 100,
-        player_stats['midrange_fg'] * 100
-    ]
-    
-    target_values = [
-        target_stats['ppg'], target_stats['rpg'], target_stats['apg'],
-        target_stats['fg_pct'] * 100, target_stats['three_pct'] * 100,
-        target_stats['ft_pct'] * 100, target_stats['paint_fg'] * 100,
-        target_stats['midrange_fg'] * 100
-    ]
-    
     fig = go.Figure()
-    
-    fig.add_trace(go.Scatterpolar(
+
+    # add_scatterpolar skips the explicit trace constructor, and mode='lines'
+    # avoids per-vertex marker rendering on reruns
+    fig.add_scatterpolar(
         r=player_values,
         theta=categories,
         fill='toself',
+        mode='lines',
         name=player_name,
-        line_color='rgb(255, 0, 0)'
-    ))
-    
-    fig.add_trace(go.Scatterpolar(
+        line_color='rgb(255, 0, 0)',
+        fillcolor='rgba(255, 0, 0, 0.1)' if advanced else None
+    )
+
+    fig.add_scatterpolar(
         r=target_values,
         theta=categories,
         fill='toself',
+        mode='lines',
         name=target_name,
-        line_color='rgb(0, 0, 255)'
-    ))
-    
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[0, max(max(player_values), max(target_values)) * 1.1]
-            )),
-        showlegend=True,
-        title=f"{player_name} vs {target_name} Comparison"
+        line_color='rgb(0, 0, 255)',
+        fillcolor='rgba(0, 0, 255, 0.1)' if advanced else None
     )
-    
+
+    max_value = max(player_values.max(), target_values.max()) * 1.1
+    radial_axis = dict(visible=True, range=[0, max_value])
+    layout = dict(polar=dict(radialaxis=radial_axis), showlegend=True)
+    if advanced:
+        radial_axis.update(tickmode='linear', tick0=0, dtick=max_value / 5)
+        layout.update(
+            title=f"{player_name} vs {target_name} - Advanced Comparison",
+            height=600
+        )
+    else:
+        layout.update(title=f"{player_name} vs {target_name} Comparison")
+    fig.update_layout(**layout)
+
     return fig
 
+def create_comparison_chart(player_stats, target_stats, player_name, target_name):
+    """Create a radar chart comparing player stats"""
+    return _build_radar_chart(
+        player_stats, target_stats, player_name, target_name, RADAR_CATS_BASIC
+    )
+
 def display_detailed_stats(stats, title):
     """Display detailed stats in a formatted way"""
     st.subheader(title)
@@ -378,16 +530,18 @@ def get_advanced_player_stats(player_id, season="2023-24"):
         
         if shooting_data and len(shooting_data) > 1:
             shot_areas = shooting_data[1]  # Shot areas data frame
-            if not shot_areas.empty:
-                # Extract specific shooting zones
-                for _, row in shot_areas.iterrows():
-                    zone = row.get('GROUP_VALUE', '').lower()
+            if not shot_areas.empty and {'GROUP_VALUE', 'FG_PCT'} <= set(shot_areas.columns):
+                # Extract specific shooting zones; zip over the two columns
+                # instead of building a Series per row with iterrows
+                for zone, fg_pct in zip(shot_areas['GROUP_VALUE'], shot_areas['FG_PCT']):
+                    zone = str(zone).lower()
+                    fg_pct = float(fg_pct) if fg_pct else 0
                     if 'paint' in zone:
-                        advanced_stats['paint_fg'] = float(row.get('FG_PCT', 0)) if row.get('FG_PCT') else 0
+                        advanced_stats['paint_fg'] = fg_pct
                     elif 'mid-range' in zone or 'midrange' in zone:
-                        advanced_stats['midrange_fg'] = float(row.get('FG_PCT', 0)) if row.get('FG_PCT') else 0
+                        advanced_stats['midrange_fg'] = fg_pct
                     elif 'corner 3' in zone:
-                        advanced_stats['corner_three'] = float(row.get('FG_PCT', 0)) if row.get('FG_PCT') else 0
+                        advanced_stats['corner_three'] = fg_pct
         
         # Clutch performance
         from nba_api.stats.endpoints import playerdashboardbyclutch
@@ -411,79 +565,12 @@ def get_advanced_player_stats(player_id, season="2023-24"):
 
 def create_advanced_comparison_chart(player_stats, target_stats, player_name, target_name):
     """Create enhanced radar chart with more categories"""
-    categories = [
-        'PPG', 'RPG', 'APG', 'FG%', '3P%', 'FT%', 
-        'Paint FG%', 'Mid-Range FG%', 'Corner 3%', 'Clutch FG%'
-    ]
-    
-    def get_stat_value(stats, stat_key, is_percentage=False):
-        value = stats.get(stat_key, 0)
-        return value * 100 if is_percentage and value <= 1 else value
-    
-    player_values = [
-        get_stat_value(player_stats, 'ppg'),
-        get_stat_value(player_stats, 'rpg'),
-        get_stat_value(player_stats, 'apg'),
-        get_stat_value(player_stats, 'fg_pct', True),
-        get_stat_value(player_stats, 'three_pct', True),
-        get_stat_value(player_stats, 'ft_pct', True),
-        get_stat_value(player_stats, 'paint_fg', True),
-        get_stat_value(player_stats, 'midrange_fg', True),
-        get_stat_value(player_stats, 'corner_three', True),
-        get_stat_value(player_stats, 'clutch_fg', True)
-    ]
-    
-    target_values = [
-        get_stat_value(target_stats, 'ppg'),
-        get_stat_value(target_stats, 'rpg'),
-        get_stat_value(target_stats, 'apg'),
-        get_stat_value(target_stats, 'fg_pct', True),
-        get_stat_value(target_stats, 'three_pct', True),
-        get_stat_value(target_stats, 'ft_pct', True),
-        get_stat_value(target_stats, 'paint_fg', True),
-        get_stat_value(target_stats, 'midrange_fg', True),
-        get_stat_value(target_stats, 'corner_three', True),
-        get_stat_value(target_stats, 'clutch_fg', True)
-    ]
-    
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatterpolar(
-        r=player_values,
-        theta=categories,
-        fill='toself',
-        name=player_name,
-        line_color='rgb(255, 0, 0)',
-        fillcolor='rgba(255, 0, 0, 0.1)'
-    ))
-    
-    fig.add_trace(go.Scatterpolar(
-        r=target_values,
-        theta=categories,
-        fill='toself',
-        name=target_name,
-        line_color='rgb(0, 0, 255)',
-        fillcolor='rgba(0, 0, 255, 0.1)'
-    ))
-    
-    max_value = max(max(player_values), max(target_values)) * 1.1
-    
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[0, max_value],
-                tickmode='linear',
-                tick0=0,
-                dtick=max_value/5
-            )),
-        showlegend=True,
-        title=f"{player_name} vs {target_name} - Advanced Comparison",
-        height=600
+    return _build_radar_chart(
+        player_stats, target_stats, player_name, target_name,
+        RADAR_CATS_ADVANCED, advanced=True
     )
-    
-    return fig
 
+@st.cache_data(ttl=3600)
 def get_shot_chart_data(player_id, season="2023-24"):
     """Get shot chart data for visualization"""
     try:
@@ -501,63 +588,103 @@ def get_shot_chart_data(player_id, season="2023-24"):
         
         if shot_data.empty:
             return None
-            
+
         # Add rate limiting
         time.sleep(0.6)
-        
-        return shot_data
+
+        # Keep only the columns the charts and zone analysis actually read;
+        # the endpoint returns ~24 and the rest just bloat the cache
+        shot_data = shot_data[[
+            'LOC_X', 'LOC_Y', 'SHOT_DISTANCE', 'SHOT_MADE_FLAG', 'SHOT_TYPE',
+            'ACTION_TYPE', 'PERIOD', 'MINUTES_REMAINING', 'SECONDS_REMAINING'
+        ]]
+
+        # Downcast the hot columns: coordinates fit int16, distance and the
+        # made flag fit int8, and SHOT_TYPE has two values
+        return shot_data.astype({
+            'LOC_X': np.int16,
+            'LOC_Y': np.int16,
+            'SHOT_DISTANCE': np.int8,
+            'SHOT_MADE_FLAG': np.int8,
+            'SHOT_TYPE': 'category'
+        })
         
     except Exception as e:
         st.error(f"Error fetching shot chart data: {e}")
         return None
 
+# Court geometry is identical on every render; compute the arcs once at import
+_THETA_ARC = np.linspace(-np.pi/2, np.pi/2, 100)
+THREE_PT_X = 23.75 * np.cos(_THETA_ARC)         # 23.75 feet from basket
+THREE_PT_Y = 23.75 * np.sin(_THETA_ARC) + 5.25  # 5.25 feet from baseline
+_THETA_FT = np.linspace(0, 2*np.pi, 100)
+FT_CIRCLE_X = 6 * np.cos(_THETA_FT)
+FT_CIRCLE_Y = 6 * np.sin(_THETA_FT) + 19
+
 def create_shot_chart(shot_data, player_name):
     """Create interactive shot chart visualization"""
     if shot_data is None or shot_data.empty:
         st.warning(f"No shot chart data available for {player_name}")
         return None
     
-    # Convert coordinates (NBA API uses 1/10th feet, origin at basket)
-    shot_data['X_COORD'] = shot_data['LOC_X'] / 10
-    shot_data['Y_COORD'] = shot_data['LOC_Y'] / 10
-    
-    # Create color mapping for makes/misses
-    shot_data['COLOR'] = shot_data['SHOT_MADE_FLAG'].map({1: 'Made', 0: 'Missed'})
-    shot_data['SIZE'] = 8  # Uniform size for all shots
-    
-    # Create the plot
-    fig = px.scatter(
-        shot_data,
-        x='X_COORD',
-        y='Y_COORD',
-        color='COLOR',
-        color_discrete_map={'Made': '#00FF00', 'Missed': '#FF0000'},
-        hover_data={
-            'SHOT_DISTANCE': True,
-            'SHOT_TYPE': True,
-            'ACTION_TYPE': True,
-            'PERIOD': True,
-            'MINUTES_REMAINING': True,
-            'SECONDS_REMAINING': True,
-            'X_COORD': False,
-            'Y_COORD': False
-        },
-        labels={'X_COORD': 'Court Position (X)', 'Y_COORD': 'Court Position (Y)'}
-    )
+    # Convert coordinates (NBA API uses 1/10th feet, origin at basket) into
+    # locals; the cached frame stays untouched
+    x = (shot_data['LOC_X'] / 10).to_numpy()
+    y = (shot_data['LOC_Y'] / 10).to_numpy()
+
+    if len(shot_data) > 500:
+        # Dense charts: aggregate into a made-minus-missed grid so the browser
+        # renders ~900 heatmap cells instead of thousands of scatter markers
+        made = shot_data['SHOT_MADE_FLAG'].to_numpy() == 1
+        grid_range = [[-25, 25], [-2.5, 47]]
+        h_made, xedges, yedges = np.histogram2d(x[made], y[made], bins=30, range=grid_range)
+        h_miss, _, _ = np.histogram2d(x[~made], y[~made], bins=30, range=grid_range)
+
+        fig = go.Figure(go.Heatmap(
+            x=(xedges[:-1] + xedges[1:]) / 2,
+            y=(yedges[:-1] + yedges[1:]) / 2,
+            z=(h_made - h_miss).T,
+            colorscale='RdYlGn',
+            colorbar=dict(title='Makes - Misses')
+        ))
+    else:
+        # assign returns a copy, so the plot columns never leak into the
+        # cached frame
+        plot_data = shot_data.assign(
+            X_COORD=x,
+            Y_COORD=y,
+            COLOR=shot_data['SHOT_MADE_FLAG'].map({1: 'Made', 0: 'Missed'}),
+            SIZE=8  # Uniform size for all shots
+        )
+
+        # Create the plot
+        fig = px.scatter(
+            plot_data,
+            x='X_COORD',
+            y='Y_COORD',
+            color='COLOR',
+            color_discrete_map={'Made': '#00FF00', 'Missed': '#FF0000'},
+            hover_data={
+                'SHOT_DISTANCE': True,
+                'SHOT_TYPE': True,
+                'ACTION_TYPE': True,
+                'PERIOD': True,
+                'MINUTES_REMAINING': True,
+                'SECONDS_REMAINING': True,
+                'X_COORD': False,
+                'Y_COORD': False
+            },
+            labels={'X_COORD': 'Court Position (X)', 'Y_COORD': 'Court Position (Y)'}
+        )
     
     # Add court outline (simplified)
     # Basketball court dimensions: 50 feet wide, 94 feet long (half court ~47 feet)
     court_shapes = []
     
-    # Three-point line (simplified arc)
-    theta = np.linspace(-np.pi/2, np.pi/2, 100)
-    three_point_x = 23.75 * np.cos(theta)  # 23.75 feet from basket
-    three_point_y = 23.75 * np.sin(theta) + 5.25  # 5.25 feet from baseline
-    
-    # Add three-point arc
+    # Add three-point arc (simplified)
     fig.add_trace(go.Scatter(
-        x=three_point_x,
-        y=three_point_y,
+        x=THREE_PT_X,
+        y=THREE_PT_Y,
         mode='lines',
         line=dict(color='black', width=2),
         name='3-Point Line',
@@ -571,13 +698,9 @@ def create_shot_chart(shot_data, player_name):
     fig.add_hline(y=47, line_dash="solid", line_color="black", line_width=2)    # Half court
     
     # Free throw circle
-    theta_ft = np.linspace(0, 2*np.pi, 100)
-    ft_circle_x = 6 * np.cos(theta_ft)
-    ft_circle_y = 6 * np.sin(theta_ft) + 19
-    
     fig.add_trace(go.Scatter(
-        x=ft_circle_x,
-        y=ft_circle_y,
+        x=FT_CIRCLE_X,
+        y=FT_CIRCLE_Y,
         mode='lines',
         line=dict(color='black', width=1),
         name='Free Throw Circle',
@@ -622,68 +745,145 @@ def create_shot_chart(shot_data, player_name):
     
     return fig
 
-def create_nba_style_zone_chart(shot_data, player_name):
-    """Create NBA-style zone-based shot chart with colored regions"""
-    if shot_data is None or shot_data.empty:
-        st.warning(f"No shot chart data available for {player_name}")
-        return None
-    
-    # Define the exact zones from the reference image
-    def get_shot_zone(x, y, distance):
-        """Categorize shots into NBA zones based on court position"""
-        # Convert to feet (if not already)
-        x_ft = x / 10 if abs(x) > 100 else x
-        y_ft = y / 10 if abs(y) > 100 else y
-        
-        # Zone definitions based on NBA court areas
-        if distance <= 8:  # Close range/Paint
+# All zone labels in classification order; the last one is the np.select default.
+# Grouping on a fixed Categorical uses integer codes instead of hashing strings.
+ZONE_LABELS = (
+    'Paint', 'Close Range',
+    'Left Baseline Mid', 'Right Baseline Mid', 'Mid-Range Center',
+    'Left Mid-Range', 'Right Mid-Range', 'Top of Key',
+    'Left Corner 3', 'Right Corner 3',
+    'Left Wing 3', 'Right Wing 3',
+    'Top of Arc 3',
+)
+ZONE_DTYPE = pd.CategoricalDtype(ZONE_LABELS)
+
+def _zone_code_kernel(x, y, distance, out):
+    """Write ZONE_LABELS indices for every shot in one fused loop"""
+    for i in range(x.size):
+        x_ft = x[i] / 10 if abs(x[i]) > 100 else x[i]
+        y_ft = y[i] / 10 if abs(y[i]) > 100 else y[i]
+        if distance[i] <= 8:
             if abs(x_ft) <= 8 and y_ft <= 19:
-                return "Paint"
+                out[i] = 0   # Paint
             else:
-                return "Close Range"
-        elif distance <= 16:  # Mid-range areas
+                out[i] = 1   # Close Range
+        elif distance[i] <= 16:
             if y_ft <= 14:
                 if x_ft < -8:
-                    return "Left Baseline Mid"
+                    out[i] = 2   # Left Baseline Mid
                 elif x_ft > 8:
-                    return "Right Baseline Mid"
+                    out[i] = 3   # Right Baseline Mid
                 else:
-                    return "Mid-Range Center"
+                    out[i] = 4   # Mid-Range Center
             else:
                 if x_ft < -6:
-                    return "Left Mid-Range"
+                    out[i] = 5   # Left Mid-Range
                 elif x_ft > 6:
-                    return "Right Mid-Range"
+                    out[i] = 6   # Right Mid-Range
                 else:
-                    return "Top of Key"
-        else:  # Three-point range
-            # Corner 3s
+                    out[i] = 7   # Top of Key
+        else:
             if abs(x_ft) > 22 and y_ft <= 14:
-                return "Left Corner 3" if x_ft < 0 else "Right Corner 3"
-            # Wing 3s
+                out[i] = 8 if x_ft < 0 else 9    # Left/Right Corner 3
             elif 14 < y_ft <= 26:
-                return "Left Wing 3" if x_ft < 0 else "Right Wing 3"
-            # Top of arc
+                out[i] = 10 if x_ft < 0 else 11  # Left/Right Wing 3
             else:
-                return "Top of Arc 3"
-    
-    # Categorize all shots
-    shot_data['ZONE'] = shot_data.apply(
-        lambda row: get_shot_zone(row['LOC_X'], row['LOC_Y'], row['SHOT_DISTANCE']), 
-        axis=1
+                out[i] = 12  # Top of Arc 3
+
+if njit is not None:
+    _zone_code_kernel = njit(cache=True)(_zone_code_kernel)
+
+def _classify_shot_zones(shot_data):
+    """Categorize shots into NBA zones: a compiled kernel when Numba is
+    available, vectorized masks otherwise"""
+    # Convert to feet (NBA API coordinates are 1/10th feet); float32 keeps the
+    # intermediate arrays half the size of the float64 default
+    x = shot_data['LOC_X'].to_numpy().astype(np.float32)
+    y = shot_data['LOC_Y'].to_numpy().astype(np.float32)
+    distance = shot_data['SHOT_DISTANCE'].to_numpy()
+
+    if njit is not None:
+        # One tight int8-coded loop with no boolean temporaries
+        codes = np.empty(x.size, dtype=np.int8)
+        _zone_code_kernel(x, y, distance, codes)
+        return pd.Categorical.from_codes(codes, dtype=ZONE_DTYPE)
+
+    x_ft = np.where(np.abs(x) > 100, x / 10, x)
+    y_ft = np.where(np.abs(y) > 100, y / 10, y)
+
+    close = distance <= 8
+    mid = distance <= 16
+    baseline = y_ft <= 14
+    left = x_ft < 0
+
+    # Zone definitions based on NBA court areas; conditions are ordered to match
+    # the original if/else ladder so the first match wins
+    conditions = [
+        close & (np.abs(x_ft) <= 8) & (y_ft <= 19),
+        close,
+        mid & baseline & (x_ft < -8),
+        mid & baseline & (x_ft > 8),
+        mid & baseline,
+        mid & (x_ft < -6),
+        mid & (x_ft > 6),
+        mid,
+        (np.abs(x_ft) > 22) & baseline & left,
+        (np.abs(x_ft) > 22) & baseline,
+        (y_ft > 14) & (y_ft <= 26) & left,
+        (y_ft > 14) & (y_ft <= 26),
+    ]
+    zones = np.select(conditions, list(ZONE_LABELS[:-1]), default=ZONE_LABELS[-1])
+    return pd.Categorical(zones, dtype=ZONE_DTYPE)
+
+# Zone shapes (simplified rectangles and polygons for each zone) and their
+# centroids for annotation placement, computed once at import
+ZONE_SHAPES = {
+    "Paint": {"x": [-8, 8, 8, -8, -8], "y": [-2.5, -2.5, 19, 19, -2.5]},
+    "Left Corner 3": {"x": [-25, -22, -22, -25, -25], "y": [-2.5, -2.5, 14, 14, -2.5]},
+    "Right Corner 3": {"x": [22, 25, 25, 22, 22], "y": [-2.5, -2.5, 14, 14, -2.5]},
+    "Left Baseline Mid": {"x": [-22, -8, -8, -22, -22], "y": [-2.5, -2.5, 14, 14, -2.5]},
+    "Right Baseline Mid": {"x": [8, 22, 22, 8, 8], "y": [-2.5, -2.5, 14, 14, -2.5]},
+    "Left Wing 3": {"x": [-25, -22, -8, -12, -25], "y": [14, 14, 19, 26, 26]},
+    "Right Wing 3": {"x": [25, 22, 8, 12, 25], "y": [14, 14, 19, 26, 26]},
+    "Left Mid-Range": {"x": [-22, -8, -8, -22, -22], "y": [14, 14, 19, 19, 14]},
+    "Right Mid-Range": {"x": [8, 22, 22, 8, 8], "y": [14, 14, 19, 19, 14]},
+    "Top of Key": {"x": [-8, 8, 8, -8, -8], "y": [19, 19, 26, 26, 19]},
+    "Top of Arc 3": {"x": [-12, 12, 12, -12, -12], "y": [26, 26, 40, 40, 26]}
+}
+
+ZONE_CENTROIDS = {
+    name: (float(np.mean(coords['x'][:-1])), float(np.mean(coords['y'][:-1])))
+    for name, coords in ZONE_SHAPES.items()
+}
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_shot_zones_cached(player_id, season="2023-24"):
+    """Zone classification memoized by player id, shared by chart and summary"""
+    shot_data = get_shot_chart_data(player_id, season)
+    if shot_data is None:
+        return None
+    return _classify_shot_zones(shot_data)
+
+def create_nba_style_zone_chart(shot_data, player_name, zones=None):
+    """Create NBA-style zone-based shot chart with colored regions"""
+    if shot_data is None or shot_data.empty:
+        st.warning(f"No shot chart data available for {player_name}")
+        return None
+
+    # Categorize all shots (reuse precomputed zones when the caller has them);
+    # grouping by an external key leaves the cached frame unmodified
+    if zones is None:
+        zones = _classify_shot_zones(shot_data)
+    zone_key = pd.Series(zones, index=shot_data.index, name='ZONE')
+
+    # Calculate zone statistics with named aggregations (no MultiIndex to flatten)
+    zone_stats = (
+        shot_data['SHOT_MADE_FLAG']
+        .groupby(zone_key, sort=False, observed=True)
+        .agg(Attempts='size', Makes='sum', FG_PCT='mean')
+        .reset_index()
     )
-    
-    # Calculate zone statistics
-    zone_stats = shot_data.groupby('ZONE').agg({
-        'SHOT_MADE_FLAG': ['count', 'sum', 'mean']
-    })
-    
-    # Flatten the MultiIndex columns properly
-    zone_stats.columns = zone_stats.columns.droplevel(0)
-    zone_stats.columns = ['Attempts', 'Makes', 'FG_PCT']
-    zone_stats = zone_stats.reset_index()
-    zone_stats = zone_stats.round(3)
-    
+
     # Create the court figure
     fig = go.Figure()
     
@@ -697,40 +897,22 @@ def create_nba_style_zone_chart(shot_data, player_name):
         else:
             return 'rgba(244, 67, 54, 0.8)'   # Red
     
-    # Define zone shapes (simplified rectangles and polygons for each zone)
-    zone_shapes = {
-        "Paint": {"x": [-8, 8, 8, -8, -8], "y": [-2.5, -2.5, 19, 19, -2.5]},
-        "Left Corner 3": {"x": [-25, -22, -22, -25, -25], "y": [-2.5, -2.5, 14, 14, -2.5]},
-        "Right Corner 3": {"x": [22, 25, 25, 22, 22], "y": [-2.5, -2.5, 14, 14, -2.5]},
-        "Left Baseline Mid": {"x": [-22, -8, -8, -22, -22], "y": [-2.5, -2.5, 14, 14, -2.5]},
-        "Right Baseline Mid": {"x": [8, 22, 22, 8, 8], "y": [-2.5, -2.5, 14, 14, -2.5]},
-        "Left Wing 3": {"x": [-25, -22, -8, -12, -25], "y": [14, 14, 19, 26, 26]},
-        "Right Wing 3": {"x": [25, 22, 8, 12, 25], "y": [14, 14, 19, 26, 26]},
-        "Left Mid-Range": {"x": [-22, -8, -8, -22, -22], "y": [14, 14, 19, 19, 14]},
-        "Right Mid-Range": {"x": [8, 22, 22, 8, 8], "y": [14, 14, 19, 19, 14]},
-        "Top of Key": {"x": [-8, 8, 8, -8, -8], "y": [19, 19, 26, 26, 19]},
-        "Top of Arc 3": {"x": [-12, 12, 12, -12, -12], "y": [26, 26, 40, 40, 26]}
-    }
-    
     # Add court outline first
     # Three-point arc
-    theta = np.linspace(-np.pi/2, np.pi/2, 100)
-    three_point_x = 23.75 * np.cos(theta)
-    three_point_y = 23.75 * np.sin(theta) + 5.25
-    
     fig.add_trace(go.Scatter(
-        x=three_point_x, y=three_point_y,
+        x=THREE_PT_X, y=THREE_PT_Y,
         mode='lines', line=dict(color='white', width=3),
         name='3-Point Line', showlegend=False
     ))
     
-    # Add zone shapes with colors based on efficiency
-    for _, row in zone_stats.iterrows():
-        zone = row['ZONE']
-        if zone in zone_shapes:
-            coords = zone_shapes[zone]
-            color = get_zone_color(row['FG_PCT'])
-            
+    # Add zone shapes with colors based on efficiency (itertuples avoids
+    # building a Series per row)
+    zone_columns = zone_stats[['ZONE', 'Attempts', 'Makes', 'FG_PCT']]
+    for zone, attempts, makes, fg_pct in zone_columns.itertuples(index=False, name=None):
+        if zone in ZONE_SHAPES:
+            coords = ZONE_SHAPES[zone]
+            color = get_zone_color(fg_pct)
+
             # Add filled zone
             fig.add_trace(go.Scatter(
                 x=coords['x'],
@@ -742,18 +924,17 @@ def create_nba_style_zone_chart(shot_data, player_name):
                 name=zone,
                 showlegend=False,
                 hovertemplate=f"<b>{zone}</b><br>" +
-                            f"FG%: {row['FG_PCT']:.1%}<br>" +
-                            f"Makes: {row['Makes']}<br>" +
-                            f"Attempts: {row['Attempts']}<extra></extra>"
+                            f"FG%: {fg_pct:.1%}<br>" +
+                            f"Makes: {makes}<br>" +
+                            f"Attempts: {attempts}<extra></extra>"
             ))
-            
-            # Add text annotations
-            center_x = sum(coords['x'][:-1]) / len(coords['x'][:-1])
-            center_y = sum(coords['y'][:-1]) / len(coords['y'][:-1])
-            
+
+            # Add text annotations at the precomputed centroid
+            center_x, center_y = ZONE_CENTROIDS[zone]
+
             fig.add_annotation(
                 x=center_x, y=center_y,
-                text=f"{row['Makes']}/{row['Attempts']}<br>{row['FG_PCT']:.1%}",
+                text=f"{makes}/{attempts}<br>{fg_pct:.1%}",
                 showarrow=False,
                 font=dict(color='white', size=12, family='Arial Black'),
                 bgcolor='rgba(0,0,0,0.7)',
@@ -763,12 +944,8 @@ def create_nba_style_zone_chart(shot_data, player_name):
     
     # Add court elements
     # Free throw circle
-    theta_ft = np.linspace(0, 2*np.pi, 100)
-    ft_circle_x = 6 * np.cos(theta_ft)
-    ft_circle_y = 6 * np.sin(theta_ft) + 19
-    
     fig.add_trace(go.Scatter(
-        x=ft_circle_x, y=ft_circle_y,
+        x=FT_CIRCLE_X, y=FT_CIRCLE_Y,
         mode='lines', line=dict(color='white', width=2),
         name='Free Throw Circle', showlegend=False
     ))
@@ -821,73 +998,37 @@ def create_nba_style_zone_chart(shot_data, player_name):
     
     return fig
 
-def create_zone_efficiency_summary(shot_data, player_name):
+def create_zone_efficiency_summary(shot_data, player_name, zones=None):
     """Create a summary table of zone efficiency"""
     if shot_data is None or shot_data.empty:
         return None
-    
-    # Use the same zone categorization as the chart
-    def get_shot_zone(x, y, distance):
-        x_ft = x / 10 if abs(x) > 100 else x
-        y_ft = y / 10 if abs(y) > 100 else y
-        
-        if distance <= 8:
-            if abs(x_ft) <= 8 and y_ft <= 19:
-                return "Paint"
-            else:
-                return "Close Range"
-        elif distance <= 16:
-            if y_ft <= 14:
-                if x_ft < -8:
-                    return "Left Baseline Mid"
-                elif x_ft > 8:
-                    return "Right Baseline Mid"
-                else:
-                    return "Mid-Range Center"
-            else:
-                if x_ft < -6:
-                    return "Left Mid-Range"
-                elif x_ft > 6:
-                    return "Right Mid-Range"
-                else:
-                    return "Top of Key"
-        else:
-            if abs(x_ft) > 22 and y_ft <= 14:
-                return "Left Corner 3" if x_ft < 0 else "Right Corner 3"
-            elif 14 < y_ft <= 26:
-                return "Left Wing 3" if x_ft < 0 else "Right Wing 3"
-            else:
-                return "Top of Arc 3"
-    
-    shot_data['ZONE'] = shot_data.apply(
-        lambda row: get_shot_zone(row['LOC_X'], row['LOC_Y'], row['SHOT_DISTANCE']), 
-        axis=1
+
+    # Use the same vectorized zone categorization as the chart; group by an
+    # external key so the cached frame is not modified
+    if zones is None:
+        zones = _classify_shot_zones(shot_data)
+    zone_key = pd.Series(zones, index=shot_data.index, name='ZONE')
+
+    # Calculate comprehensive zone stats: group once, derive the mean from
+    # sum/count instead of aggregating a third time
+    grp = shot_data['SHOT_MADE_FLAG'].groupby(zone_key, sort=False, observed=True)
+    makes = grp.sum()
+    attempts = grp.count()
+    zone_stats = pd.DataFrame({
+        'Attempts': attempts,
+        'Makes': makes,
+        'FG_PCT': makes / attempts
+    }).reset_index()
+    
+    # Add efficiency rating via compiled binning; left-closed bins match the
+    # original >= 0.30/0.40/0.50 thresholds
+    zone_stats['Rating'] = pd.cut(
+        zone_stats['FG_PCT'],
+        bins=[-np.inf, 0.30, 0.40, 0.50, np.inf],
+        labels=['🔴 Poor', '🟠 Average', '🟡 Good', '🟢 Elite'],
+        right=False
     )
-    
-    # Calculate comprehensive zone stats
-    zone_stats = shot_data.groupby('ZONE').agg({
-        'SHOT_MADE_FLAG': ['count', 'sum', 'mean']
-    })
-    
-    # Flatten the MultiIndex columns properly
-    zone_stats.columns = zone_stats.columns.droplevel(0)
-    zone_stats.columns = ['Attempts', 'Makes', 'FG_PCT'] 
-    zone_stats = zone_stats.reset_index()
-    zone_stats = zone_stats.round(3)
-    
-    # Add efficiency rating
-    def get_efficiency_rating(fg_pct):
-        if fg_pct >= 0.50:
-            return "🟢 Elite"
-        elif fg_pct >= 0.40:
-            return "🟡 Good"
-        elif fg_pct >= 0.30:
-            return "🟠 Average"
-        else:
-            return "🔴 Poor"
-    
-    zone_stats['Rating'] = zone_stats['FG_PCT'].apply(get_efficiency_rating)
-    zone_stats['FG%'] = zone_stats['FG_PCT'].apply(lambda x: f"{x:.1%}")
+    zone_stats['FG%'] = zone_stats['FG_PCT'].map('{:.1%}'.format)
     
     # Sort by attempts (most frequent zones first)
     zone_stats = zone_stats.sort_values('Attempts', ascending=False)
@@ -913,29 +1054,33 @@ def analyze_shot_chart_data(shot_data, player_name):
     avg_distance = shot_data['SHOT_DISTANCE'].mean()
     analysis['avg_shot_distance'] = avg_distance
     
-    # Three-point vs two-point split
-    three_pointers = shot_data[shot_data['SHOT_TYPE'] == '3PT Field Goal']
-    two_pointers = shot_data[shot_data['SHOT_TYPE'] == '2PT Field Goal']
-    
-    analysis['three_point_attempts'] = len(three_pointers)
-    analysis['three_point_pct'] = three_pointers['SHOT_MADE_FLAG'].mean() if len(three_pointers) > 0 else 0
-    analysis['two_point_attempts'] = len(two_pointers)
-    analysis['two_point_pct'] = two_pointers['SHOT_MADE_FLAG'].mean() if len(two_pointers) > 0 else 0
+    # Three-point vs two-point split: one groupby scan instead of two
+    # mask-filter-mean chains
+    type_grp = shot_data.groupby('SHOT_TYPE', observed=True)['SHOT_MADE_FLAG']
+    type_counts = type_grp.count()
+    type_means = type_grp.mean()
+
+    analysis['three_point_attempts'] = int(type_counts.get('3PT Field Goal', 0))
+    analysis['three_point_pct'] = float(type_means.get('3PT Field Goal', 0))
+    analysis['two_point_attempts'] = int(type_counts.get('2PT Field Goal', 0))
+    analysis['two_point_pct'] = float(type_means.get('2PT Field Goal', 0))
     
     # Shot selection analysis
     close_shots = shot_data[shot_data['SHOT_DISTANCE'] <= 8]
     analysis['close_shot_frequency'] = len(close_shots) / total_shots if total_shots > 0 else 0
     analysis['close_shot_pct'] = close_shots['SHOT_MADE_FLAG'].mean() if len(close_shots) > 0 else 0
     
-    # Best shooting zone
-    shot_data['ZONE'] = shot_data.apply(
-        lambda row: 'Paint' if row['SHOT_DISTANCE'] <= 8
-        else 'Mid-Range' if row['SHOT_DISTANCE'] <= 16
-        else 'Corner 3' if 'Corner 3' in row['SHOT_TYPE']
-        else '3-Point', axis=1
+    # Best shooting zone (vectorized: one pass over the distance/type columns;
+    # the labels stay in a local array rather than a column on the cached frame)
+    dist = shot_data['SHOT_DISTANCE'].to_numpy()
+    is_corner3 = shot_data['SHOT_TYPE'].astype(str).str.contains('Corner 3', regex=False).to_numpy()
+    zones = np.select(
+        [dist <= 8, dist <= 16, is_corner3],
+        ['Paint', 'Mid-Range', 'Corner 3'],
+        default='3-Point'
     )
-    
-    zone_stats = shot_data.groupby('ZONE')['SHOT_MADE_FLAG'].agg(['count', 'mean'])
+
+    zone_stats = shot_data['SHOT_MADE_FLAG'].groupby(zones).agg(['count', 'mean'])
     zone_stats = zone_stats[zone_stats['count'] >= 10]  # Minimum 10 attempts
     
     if not zone_stats.empty:
@@ -945,10 +1090,23 @@ def analyze_shot_chart_data(shot_data, player_name):
     
     return analysis
 
-def display_shot_chart_insights(shot_data, player_name):
-    """Display shot chart insights in the UI"""
-    analysis = analyze_shot_chart_data(shot_data, player_name)
-    
+# Reruns triggered by sidebar widgets re-render the shot chart section, so the
+# zoning + groupby work is memoized per player rather than recomputed each time
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_zone_summary_cached(player_id, player_name, season="2023-24"):
+    """Zone efficiency summary memoized by player id"""
+    return create_zone_efficiency_summary(
+        get_shot_chart_data(player_id, season), player_name,
+        zones=get_shot_zones_cached(player_id, season)
+    )
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_shot_analysis_cached(player_id, player_name, season="2023-24"):
+    """Shot chart analysis memoized by player id"""
+    return analyze_shot_chart_data(get_shot_chart_data(player_id, season), player_name)
+
+def display_shot_chart_insights(analysis, player_name):
+    """Display precomputed shot chart insights in the UI"""
     if not analysis:
         return
     
@@ -988,35 +1146,40 @@ def display_shot_chart_insights(shot_data, player_name):
         else:
             st.metric("Best Zone", "N/A", help="Insufficient data")
     
-    # Additional insights
+    # Additional insights (one markdown call per column instead of a widget
+    # per bullet)
     col1, col2 = st.columns(2)
-    
+
     with col1:
-        st.write("**Shot Distribution:**")
         three_pct = analysis.get('three_point_attempts', 0) / analysis.get('total_shots', 1) * 100
         two_pct = analysis.get('two_point_attempts', 0) / analysis.get('total_shots', 1) * 100
-        st.write(f"• 3-Point Attempts: {three_pct:.1f}% ({analysis.get('three_point_pct', 0):.1%} FG%)")
-        st.write(f"• 2-Point Attempts: {two_pct:.1f}% ({analysis.get('two_point_pct', 0):.1%} FG%)")
-        st.write(f"• Close Range Frequency: {analysis.get('close_shot_frequency', 0):.1%}")
-    
+        st.markdown(
+            "**Shot Distribution:**\n"
+            f"- 3-Point Attempts: {three_pct:.1f}% ({analysis.get('three_point_pct', 0):.1%} FG%)\n"
+            f"- 2-Point Attempts: {two_pct:.1f}% ({analysis.get('two_point_pct', 0):.1%} FG%)\n"
+            f"- Close Range Frequency: {analysis.get('close_shot_frequency', 0):.1%}"
+        )
+
     with col2:
-        st.write("**Shooting Tendencies:**")
+        tendencies = []
         if analysis.get('avg_shot_distance', 0) > 18:
-            st.write("• Perimeter-oriented shooter")
+            tendencies.append("Perimeter-oriented shooter")
         elif analysis.get('avg_shot_distance', 0) < 12:
-            st.write("• Paint-focused player")
+            tendencies.append("Paint-focused player")
         else:
-            st.write("• Balanced shot selection")
-            
+            tendencies.append("Balanced shot selection")
+
         if analysis.get('close_shot_frequency', 0) > 0.4:
-            st.write("• High close-range frequency")
+            tendencies.append("High close-range frequency")
         elif analysis.get('close_shot_frequency', 0) < 0.2:
-            st.write("• Limited paint presence")
-        
+            tendencies.append("Limited paint presence")
+
         if analysis.get('three_point_pct', 0) > 0.37:
-            st.write("• Elite 3-point shooter")
+            tendencies.append("Elite 3-point shooter")
         elif analysis.get('three_point_pct', 0) > 0.33:
-            st.write("• Good 3-point shooter")
+            tendencies.append("Good 3-point shooter")
+
+        st.markdown("**Shooting Tendencies:**\n" + "\n".join(f"- {t}" for t in tendencies))
 
 def display_player_database_info():
     """Display information about the player database"""
@@ -1045,15 +1208,13 @@ def display_player_database_info():
         cache_percentage = (cached_players / total_players) * 100
         st.sidebar.progress(cache_percentage / 100, f"Cache: {cache_percentage:.1f}%")
 
-def get_popular_teams():
-    """Get list of popular NBA teams for better player filtering"""
-    popular_teams = [
-        'Los Angeles Lakers', 'Golden State Warriors', 'Boston Celtics',
-        'Miami Heat', 'Chicago Bulls', 'San Antonio Spurs',
-        'Los Angeles Clippers', 'Brooklyn Nets', 'Philadelphia 76ers',
-        'Milwaukee Bucks', 'Denver Nuggets', 'Phoenix Suns'
-    ]
-    return popular_teams
+# Popular NBA teams for better player filtering
+POPULAR_TEAMS = (
+    'Los Angeles Lakers', 'Golden State Warriors', 'Boston Celtics',
+    'Miami Heat', 'Chicago Bulls', 'San Antonio Spurs',
+    'Los Angeles Clippers', 'Brooklyn Nets', 'Philadelphia 76ers',
+    'Milwaukee Bucks', 'Denver Nuggets', 'Phoenix Suns'
+)
 
 # Main app
 def main():
@@ -1091,11 +1252,15 @@ def main():
         help="Search through all active NBA players"
     )
     
-    # Filter players based on search
+    # Filter players based on search (against the precomputed lowercase list)
     if search_term:
+        needle = search_term.lower()
+        players_lower = st.session_state.get('available_players_lower')
+        if players_lower is None or len(players_lower) != len(available_players):
+            players_lower = [p.lower() for p in available_players]
         filtered_players = [
-            player for player in available_players 
-            if search_term.lower() in player.lower()
+            available_players[i] for i, player_lower in enumerate(players_lower)
+            if needle in player_lower
         ]
         if filtered_players:
             available_players_list = filtered_players
@@ -1103,9 +1268,10 @@ def main():
             st.sidebar.warning(f"No players found matching '{search_term}'")
             available_players_list = available_players[:20]  # Show first 20 as fallback
     else:
-        # Show popular players first, then all others
-        popular_players = [p for p in available_players if p in FALLBACK_PLAYERS.keys()]
-        other_players = [p for p in available_players if p not in FALLBACK_PLAYERS.keys()]
+        # Show popular players first, then all others (one pass, set lookups)
+        popular_players, other_players = [], []
+        for player in available_players:
+            (popular_players if player in POPULAR_PLAYERS else other_players).append(player)
         available_players_list = popular_players + other_players
     
     # Select project player
@@ -1135,7 +1301,7 @@ def main():
     else:
         target = st.sidebar.selectbox(
             "Select Target Archetype:",
-            list(ARCHETYPES.keys())
+            ARCHETYPE_NAMES
         )
         target_stats = ARCHETYPES[target]
         target_name = f"{target} Archetype"
@@ -1150,8 +1316,11 @@ def main():
         
         if player_info and target_info:
             with st.spinner("Loading advanced statistics..."):
-                advanced_player_stats = get_advanced_player_stats(player_info['id'])
-                advanced_target_stats = get_advanced_player_stats(target_info['id'])
+                # The two fetches are independent network calls; run them in parallel
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    advanced_player_stats, advanced_target_stats = executor.map(
+                        get_advanced_player_stats, [player_info['id'], target_info['id']]
+                    )
                 
                 # Merge advanced stats with basic stats
                 if advanced_player_stats:
@@ -1212,47 +1381,68 @@ def main():
         target_info = get_player_by_name(target)
         
         if player_info and target_info:
+            # Computed once per player and reused by the comparison block below
+            player_zone_summary = None
+            target_zone_summary = None
+
+            # Fetch both shot charts concurrently before rendering the columns
+            with st.spinner("Loading shot charts..."):
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    player_shot_data, target_shot_data = executor.map(
+                        get_shot_chart_data, [player_info['id'], target_info['id']]
+                    )
+
             col1, col2 = st.columns(2)
-            
+
             with col1:
                 st.subheader(f"{project_player} Shot Chart")
                 with st.spinner(f"Loading shot chart for {project_player}..."):
-                    player_shot_data = get_shot_chart_data(player_info['id'])
                     if player_shot_data is not None:
                         # NBA-style zone chart
-                        zone_chart_fig = create_nba_style_zone_chart(player_shot_data, project_player)
+                        zone_chart_fig = create_nba_style_zone_chart(
+                            player_shot_data, project_player,
+                            zones=get_shot_zones_cached(player_info['id'])
+                        )
                         if zone_chart_fig:
                             st.plotly_chart(zone_chart_fig, use_container_width=True)
-                            
+
                             # Zone efficiency summary table
-                            zone_summary = create_zone_efficiency_summary(player_shot_data, project_player)
-                            if zone_summary is not None:
+                            player_zone_summary = get_zone_summary_cached(player_info['id'], project_player)
+                            if player_zone_summary is not None:
                                 st.subheader("📊 Zone Efficiency Summary")
-                                st.dataframe(zone_summary, use_container_width=True)
-                            
+                                st.dataframe(player_zone_summary, use_container_width=True)
+
                             # Shot insights
-                            display_shot_chart_insights(player_shot_data, project_player)
+                            display_shot_chart_insights(
+                                get_shot_analysis_cached(player_info['id'], project_player),
+                                project_player
+                            )
                     else:
                         st.warning(f"No shot chart data available for {project_player}")
             
             with col2:
                 st.subheader(f"{target} Shot Chart")
                 with st.spinner(f"Loading shot chart for {target}..."):
-                    target_shot_data = get_shot_chart_data(target_info['id'])
                     if target_shot_data is not None:
                         # NBA-style zone chart
-                        target_zone_chart_fig = create_nba_style_zone_chart(target_shot_data, target)
+                        target_zone_chart_fig = create_nba_style_zone_chart(
+                            target_shot_data, target,
+                            zones=get_shot_zones_cached(target_info['id'])
+                        )
                         if target_zone_chart_fig:
                             st.plotly_chart(target_zone_chart_fig, use_container_width=True)
                             
                             # Zone efficiency summary table
-                            target_zone_summary = create_zone_efficiency_summary(target_shot_data, target)
+                            target_zone_summary = get_zone_summary_cached(target_info['id'], target)
                             if target_zone_summary is not None:
                                 st.subheader("📊 Zone Efficiency Summary")
                                 st.dataframe(target_zone_summary, use_container_width=True)
-                            
+
                             # Shot insights
-                            display_shot_chart_insights(target_shot_data, target)
+                            display_shot_chart_insights(
+                                get_shot_analysis_cached(target_info['id'], target),
+                                target
+                            )
                     else:
                         st.warning(f"No shot chart data available for {target}")
             
@@ -1263,13 +1453,11 @@ def main():
                 col1, col2 = st.columns(2)
                 with col1:
                     st.write(f"**{project_player} Zone Summary**")
-                    player_zone_summary = create_zone_efficiency_summary(player_shot_data, project_player)
                     if player_zone_summary is not None:
                         st.dataframe(player_zone_summary, use_container_width=True)
-                
+
                 with col2:
                     st.write(f"**{target} Zone Summary**")
-                    target_zone_summary = create_zone_efficiency_summary(target_shot_data, target)
                     if target_zone_summary is not None:
                         st.dataframe(target_zone_summary, use_container_width=True)
         else:
@@ -1280,33 +1468,35 @@ def main():
     # Detailed breakdown
     st.header("Detailed Analysis")
     
+    # One vectorized diff across the comparison stats feeds both columns
+    comparison_stats = ('ppg', 'rpg', 'apg', 'fg_pct', 'three_pct', 'ft_pct')
+    stat_names = [s.replace('_', ' ').replace('pct', '%').upper() for s in comparison_stats]
+    diff_pct = (
+        (stats_to_vec(player_stats, comparison_stats) - stats_to_vec(target_stats, comparison_stats))
+        / stats_to_vec(target_stats, comparison_stats) * 100
+    )
+    strengths = [
+        f"**{name}**: +{diff:.1f}% vs target"
+        for name, diff in zip(stat_names, diff_pct) if diff > 0
+    ]
+    weaknesses = [
+        f"**{name}**: -{-diff:.1f}% vs target"
+        for name, diff in zip(stat_names, diff_pct) if diff < 0
+    ]
+
     # Strengths and weaknesses
     col1, col2 = st.columns(2)
-    
+
     with col1:
         st.subheader("💪 Relative Strengths")
-        strengths = []
-        for stat in ['ppg', 'rpg', 'apg', 'fg_pct', 'three_pct', 'ft_pct']:
-            if player_stats[stat] > target_stats[stat]:
-                diff = ((player_stats[stat] - target_stats[stat]) / target_stats[stat]) * 100
-                stat_name = stat.replace('_', ' ').replace('pct', '%').upper()
-                strengths.append(f"**{stat_name}**: +{diff:.1f}% vs target")
-        
         if strengths:
             for strength in strengths[:5]:  # Show top 5
                 st.write(f"• {strength}")
         else:
             st.write("No significant statistical advantages identified")
-    
+
     with col2:
         st.subheader("⚠️ Areas for Improvement")
-        weaknesses = []
-        for stat in ['ppg', 'rpg', 'apg', 'fg_pct', 'three_pct', 'ft_pct']:
-            if player_stats[stat] < target_stats[stat]:
-                diff = ((target_stats[stat] - player_stats[stat]) / target_stats[stat]) * 100
-                stat_name = stat.replace('_', ' ').replace('pct', '%').upper()
-                weaknesses.append(f"**{stat_name}**: -{diff:.1f}% vs target")
-        
         if weaknesses:
             for weakness in weaknesses[:5]:  # Show top 5
                 st.write(f"• {weakness}")
@@ -1324,20 +1514,23 @@ def main():
             
             if shot_data is not None:
                 # Create NBA-style zone chart
-                zone_chart = create_nba_style_zone_chart(shot_data, project_player)
+                zone_chart = create_nba_style_zone_chart(
+                    shot_data, project_player,
+                    zones=get_shot_zones_cached(player_info['id'])
+                )
                 if zone_chart:
                     st.plotly_chart(zone_chart, use_container_width=True)
                 
                 # Zone efficiency summary
-                zone_summary = create_zone_efficiency_summary(shot_data, project_player)
+                zone_summary = get_zone_summary_cached(player_info['id'], project_player)
                 if zone_summary is not None:
                     st.subheader("📊 Detailed Zone Analysis")
                     st.dataframe(zone_summary, use_container_width=True)
-                
+
                 # Shot analysis insights
-                shot_analysis = analyze_shot_chart_data(shot_data, project_player)
+                shot_analysis = get_shot_analysis_cached(player_info['id'], project_player)
                 if shot_analysis:
-                    display_shot_chart_insights(shot_data, project_player)
+                    display_shot_chart_insights(shot_analysis, project_player)
             else:
                 st.warning(f"No shot chart data available for {project_player}")
         else:
@@ -1351,7 +1544,7 @@ def main():
         st.sidebar.write(f"Displayed players: {len(available_players_list)}")
         
         if search_term:
-            st.sidebar.write(f"Search results: {len([p for p in available_players if search_term.lower() in p.lower()])}")
+            st.sidebar.write(f"Search results: {len(filtered_players)}")
         
         # Show API status
         if len(available_players) > len(FALLBACK_PLAYERS):
@@ -1362,8 +1555,8 @@ def main():
         if st.sidebar.button("Clear Cache"):
             st.session_state.player_cache = {}
             st.session_state.available_players = []
-            if os.path.exists(CACHE_FILE):
-                os.remove(CACHE_FILE)
+            with _cache_db() as conn:
+                conn.execute("DELETE FROM player_stats")
             st.sidebar.success("Cache cleared!")
             st.rerun()
             